@@ -1,15 +1,38 @@
-import json
+import concurrent.futures
+import contextlib
+import hashlib
 import logging
+import os
+import random
 import re
+import tempfile
 import threading
 import time
+import orjson
 import requests
-from telebot import TeleBot, types
+from requests.adapters import HTTPAdapter
+from telebot import TeleBot, apihelper, types
+
+try:
+    import simdjson
+except ImportError:  # pysimdjson is optional, fall back to orjson
+    simdjson = None
 
 # --- Configuration ---
 CONFIG_FILE = "config.json"
 KNOWN_SUBDOMAINS_FILE = "known_subdomains.json"
+HTTP_CACHE_FILE = "http_cache.json"  # ETag / Last-Modified validators of the last crt.sh response per website
+KNOWN_SUBDOMAINS_LOG_FILE = "known_subdomains.log"  # Append-only JSONL of subdomains found since the last snapshot
 CHECK_INTERVAL = 3600  # Check every hour
+COMPACT_INTERVAL = 86400  # Fold the state log into the snapshot once a day
+HANDLER_THREADS = 4  # Worker threads running Telegram message handlers
+MAX_WORKERS = 3  # Websites checked in parallel
+MAX_CRTSH_REQUESTS = 2  # Concurrent requests allowed against crt.sh
+# Threads that may call the Telegram API at once: handlers, the polling thread, the monitoring thread
+# and the crt.sh workers (error notifications)
+TELEGRAM_POOL_SIZE = HANDLER_THREADS + 2 + MAX_WORKERS
+MESSAGE_CHUNK_SIZE = 3900  # Below Telegram's 4096-character limit, leaving room for Markdown parsing
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 
 # --- Logging ---
 logging.basicConfig(
@@ -18,21 +41,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# One name per line in crt.sh's name_value, with any wildcard prefix left outside the group
+SUBDOMAIN_NAME_RE = re.compile(r'^(?:\*\.)?([^\n]+)', re.MULTILINE)
+
+# simdjson parsers reuse an internal buffer and are not thread-safe, so keep one per thread
+_parser_local = threading.local()
+JSON_ARRAY_TYPES = (list,) if simdjson is None else (list, simdjson.Array)
+
 # --- Helper Functions ---
 def load_json(filename, default_data=None):
     """Load data from a JSON file."""
     try:
-        with open(filename, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(filename, 'rb') as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
         if default_data is not None:
             save_json(filename, default_data)
         return default_data
 
 def save_json(filename, data):
-    """Save data to a JSON file."""
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=4)
+    """Save data to a JSON file atomically, so an interrupted write never truncates it."""
+    tmp = tempfile.NamedTemporaryFile(mode='wb', dir=os.path.dirname(filename) or '.', prefix=f".{os.path.basename(filename)}.", delete=False)
+    try:
+        with tmp:
+            tmp.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        # NamedTemporaryFile is created 0600, keep the permissions the file had (or would have had)
+        try:
+            mode = os.stat(filename).st_mode & 0o7777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, filename)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp.name)
+        raise
+
+def parse_json_bytes(content):
+    """Parse a JSON payload, lazily with simdjson when it is installed.
+    Raises ValueError if the payload is not valid JSON."""
+    if simdjson is None:
+        return orjson.loads(content)
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _parser_local.parser = simdjson.Parser()
+    try:
+        return parser.parse(content)
+    except RuntimeError:
+        # Objects from an earlier parse are still alive (e.g. held by a traceback) and pin
+        # this parser, so start over with a fresh one for this thread
+        parser = _parser_local.parser = simdjson.Parser()
+        return parser.parse(content)
+
+def chunk_lines(lines, limit=MESSAGE_CHUNK_SIZE):
+    """Group lines into newline-joined messages that fit within the limit."""
+    chunk = []
+    size = 0
+    for line in lines:
+        if chunk and size + len(line) > limit:
+            yield "\n".join(chunk)
+            chunk = []
+            size = 0
+        chunk.append(line)
+        size += len(line) + 1
+    if chunk:
+        yield "\n".join(chunk)
 
 def format_time_interval(seconds):
     """Convert seconds to a human-readable format (hours, minutes, seconds)."""
@@ -50,17 +127,65 @@ def format_time_interval(seconds):
     
     return ", ".join(parts)
 
+NEXT_SCAN_TIME = format_time_interval(CHECK_INTERVAL)
+
 # --- Main Bot Class ---
 class SubdomainBot:
+    __slots__ = (
+        'config', 'admin_id', 'admin_id_int', 'password', 'bot', 'known_subdomains', 'http_cache',
+        'state_log', 'last_compaction', 'session', 'authenticated_users', 'monitoring_active', 'stop_event',
+        'monitoring_thread', 'website_set', 'config_lock', 'websites_list_cache', 'crtsh_semaphore',
+        'state_lock', 'menu_dispatch', 'last_notification_digest'
+    )
+
     def __init__(self):
         self.config = load_json(CONFIG_FILE)
         if self.config is None:
             raise FileNotFoundError(f"Configuration file '{CONFIG_FILE}' not found. Please create it with the required settings.")
-        self.bot = TeleBot(self.config["telegram_bot_token"])
-        self.known_subdomains = load_json(KNOWN_SUBDOMAINS_FILE, {})
-        self.authenticated_users = set()
+        # Hoisted out of the config dict since they are read on every message and notification
+        self.admin_id = str(self.config["admin_user_id"])
+        try:
+            self.admin_id_int = int(self.admin_id)
+        except ValueError:
+            raise ValueError(f"'admin_user_id' in '{CONFIG_FILE}' must be a numeric Telegram user ID.") from None
+        self.password = self.config["password"]
+        # Keep-alive pool for the Telegram API, shared by every thread that sends messages
+        apihelper.session = requests.Session()
+        apihelper.session.mount('https://', HTTPAdapter(pool_maxsize=TELEGRAM_POOL_SIZE))
+        self.bot = TeleBot(self.config["telegram_bot_token"], threaded=True, num_threads=HANDLER_THREADS)
+        # Kept as sets in memory for O(1) membership checks, stored as sorted lists on disk
+        self.known_subdomains = {website: set(subs) for website, subs in load_json(KNOWN_SUBDOMAINS_FILE, {}).items()}
+        self.state_lock = threading.Lock()  # Guards known_subdomains across worker threads
+        self.load_state_log()
+        self.state_log = open(KNOWN_SUBDOMAINS_LOG_FILE, 'ab', buffering=0)
+        # Fold the log into a fresh snapshot right away, so it can't grow across restarts
+        self.compact_state()
+        self.http_cache = load_json(HTTP_CACHE_FILE, {})
+        # Pooled session so repeated crt.sh requests reuse the TCP/TLS connection
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        # Immutable and replaced on change, so handler threads can read it without a lock
+        self.authenticated_users = frozenset()
         self.monitoring_active = False
+        self.stop_event = threading.Event()  # Set to stop the current monitoring thread, replaced on restart
         self.monitoring_thread = None
+        # Set mirror of config["websites"] for O(1) membership checks, both guarded by config_lock
+        self.website_set = set(self.config["websites"])
+        self.config_lock = threading.RLock()
+        self.websites_list_cache = None  # Markdown list for the "no new" notification, reset on change
+        self.last_notification_digest = None  # Fingerprint of the website list last sent in full
+        self.crtsh_semaphore = threading.Semaphore(MAX_CRTSH_REQUESTS)
+
+        # Menu button text -> handler, toggle buttons are matched separately by prefix
+        self.menu_dispatch = {
+            "➕ Add Website": self.prompt_add_website,
+            "➖ Remove Website": lambda message: self.show_websites_for_removal(message.chat.id),
+            "📋 List Websites": lambda message: self.list_websites(message.chat.id),
+        }
 
         self.setup_handlers()
 
@@ -75,7 +200,7 @@ class SubdomainBot:
 
     def is_admin(self, message):
         """Check if the user is the admin."""
-        return str(message.from_user.id) == str(self.config["admin_user_id"])
+        return message.from_user.id == self.admin_id_int
 
     def start_command(self, message):
         """Handle the /start command."""
@@ -91,8 +216,8 @@ class SubdomainBot:
 
     def check_password(self, message):
         """Check the password provided by the user."""
-        if message.text == self.config["password"]:
-            self.authenticated_users.add(message.from_user.id)
+        if message.text == self.password:
+            self.authenticated_users = self.authenticated_users | {message.from_user.id}
             self.bot.send_message(message.chat.id, "Authentication successful!")
             self.show_main_menu(message.chat.id)
         else:
@@ -123,15 +248,18 @@ class SubdomainBot:
 
     def handle_menu_selection(self, message):
         """Handle menu selections from the reply keyboard."""
-        if message.text == "➕ Add Website":
-            msg = self.bot.send_message(message.chat.id, "Please send the website URL to add (e.g., example.com):", reply_markup=types.ReplyKeyboardRemove())
-            self.bot.register_next_step_handler(msg, self.add_website)
-        elif message.text == "➖ Remove Website":
-            self.show_websites_for_removal(message.chat.id)
-        elif message.text == "📋 List Websites":
-            self.list_websites(message.chat.id)
-        elif message.text.startswith("▶️ Start Monitoring") or message.text.startswith("⏹️ Stop Monitoring"):
+        text = message.text or ""
+        if text.startswith(("▶️ Start Monitoring", "⏹️ Stop Monitoring")):
             self.toggle_monitoring(message)
+            return
+        handler = self.menu_dispatch.get(text)
+        if handler:
+            handler(message)
+
+    def prompt_add_website(self, message):
+        """Ask the user for the website to add."""
+        msg = self.bot.send_message(message.chat.id, "Please send the website URL to add (e.g., example.com):", reply_markup=types.ReplyKeyboardRemove())
+        self.bot.register_next_step_handler(msg, self.add_website)
 
     def toggle_monitoring(self, message):
         """Toggle the monitoring state."""
@@ -141,49 +269,71 @@ class SubdomainBot:
             self.start_monitoring_thread()
         else:
             self.bot.send_message(message.chat.id, "⏹️ Monitoring stopped.")
-            # The thread will stop on its own
+            self.stop_event.set()
         self.show_main_menu(message.chat.id)
 
     def start_monitoring_thread(self):
         """Start the background monitoring thread."""
-        if self.monitoring_thread is None or not self.monitoring_thread.is_alive():
-            self.monitoring_thread = threading.Thread(target=self.monitoring_loop)
+        if self.monitoring_thread is None or not self.monitoring_thread.is_alive() or self.stop_event.is_set():
+            # A thread that is still stopping exits on its own event, the new one gets a fresh event
+            self.stop_event = threading.Event()
+            self.monitoring_thread = threading.Thread(target=self.monitoring_loop, args=(self.stop_event,), name="monitoring")
             self.monitoring_thread.daemon = True
             self.monitoring_thread.start()
 
-    def monitoring_loop(self):
-        """The main loop for the monitoring thread."""
+    def monitoring_loop(self, stop_event):
+        """The main loop for the monitoring thread, runs until stop_event is set."""
         logger.info("Monitoring loop started.")
-        while self.monitoring_active:
-            new_subdomains_found = False
-            for website in self.config["websites"]:
-                found_new = self.check_website_for_subdomains(website)
-                if found_new:
-                    new_subdomains_found = True
-                # Add delay between websites to avoid rate limiting
-                if len(self.config["websites"]) > 1:
-                    time.sleep(10)  # Wait 10 seconds between different websites
+        while not stop_event.is_set():
+            results = []
+            with self.config_lock:
+                websites = tuple(self.config["websites"])
+            with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="crtsh") as executor:
+                futures = {executor.submit(self.check_website_for_subdomains, website, stop_event): website for website in websites}
+                # Collect in submission order so the notification lists websites in a stable order
+                for future, website in futures.items():
+                    try:
+                        new_subdomains = future.result()
+                    except Exception as e:
+                        logger.error(f"Unexpected error while checking {website}: {e}")
+                        continue
+                    if new_subdomains:
+                        results.append((website, new_subdomains))
             
-            # Send notification if no new subdomains were found
-            if not new_subdomains_found and self.config["websites"]:
+            # Send one combined notification for the cycle, or a summary if nothing new was found
+            if results:
+                self.send_batched_notification(results)
+            elif websites and not stop_event.is_set():
                 self.send_no_new_subdomains_notification()
+
+            if time.monotonic() - self.last_compaction >= COMPACT_INTERVAL:
+                self.compact_state()
             
-            time.sleep(CHECK_INTERVAL)
+            if stop_event.wait(CHECK_INTERVAL):
+                break
         logger.info("Monitoring loop finished.")
 
-    def check_website_for_subdomains(self, website):
+    def check_website_for_subdomains(self, website, stop_event):
         """Check for new subdomains using the crt.sh API with a retry mechanism.
-        Returns True if new subdomains were found, False otherwise."""
+        Returns the list of new subdomains, empty if none were found or monitoring was stopped."""
+        if stop_event.is_set():
+            return []
         logger.info(f"Checking crt.sh for: {website}")
         url = f"https://crt.sh/?q=%.{website}&output=json"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        # Conditional request so an unchanged result comes back as an empty 304
+        headers = {}
+        cached = self.http_cache.get(website, {})
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
         retries = 3
         for attempt in range(retries):
             try:
                 # Increase timeout to 60 seconds to handle slow responses
-                response = requests.get(url, timeout=60, headers=headers)
+                # The semaphore caps concurrent crt.sh requests across all worker threads
+                with self.crtsh_semaphore:
+                    response = self.session.get(url, timeout=60, headers=headers)
                 
                 # Handle 429 rate limiting errors with longer backoff
                 if response.status_code == 429:
@@ -196,41 +346,49 @@ class SubdomainBot:
                             wait_time = (2 ** attempt) * 300  # Default: 300s, 600s, 1200s
                     else:
                         wait_time = (2 ** attempt) * 300  # Exponential backoff: 300s, 600s, 1200s
+                    # Jitter so parallel workers don't retry in lockstep
+                    wait_time += random.uniform(1, 3)
                     
-                    logger.warning(f"429 Too Many Requests for {website} (attempt {attempt + 1}/{retries}). Waiting {wait_time}s...")
+                    logger.warning(f"429 Too Many Requests for {website} (attempt {attempt + 1}/{retries}). Waiting {wait_time:.0f}s...")
                     if attempt + 1 < retries:
-                        time.sleep(wait_time)
+                        if stop_event.wait(wait_time):
+                            return []
                         continue
                     else:
                         error_message = f"Could not fetch data from crt.sh for {website} after {retries} attempts: 429 Client Error: Too Many Requests"
                         logger.error(error_message)
                         self.send_error_notification(error_message)
-                        return False
+                        return []
                 
                 # Handle 503 errors specifically with longer backoff
                 if response.status_code == 503:
                     wait_time = (2 ** attempt) * 60  # Exponential backoff: 60s, 120s, 240s
                     logger.warning(f"503 Service Unavailable for {website} (attempt {attempt + 1}/{retries}). Waiting {wait_time}s...")
                     if attempt + 1 < retries:
-                        time.sleep(wait_time)
+                        if stop_event.wait(wait_time):
+                            return []
                         continue
                     else:
                         error_message = f"Could not fetch data from crt.sh for {website} after {retries} attempts: 503 Server Error: Service Unavailable"
                         logger.error(error_message)
                         self.send_error_notification(error_message)
-                        return False
+                        return []
                 
+                if response.status_code == 304:
+                    logger.info(f"crt.sh results for {website} unchanged since last check")
+                    return []
+
                 response.raise_for_status()
 
-                if not response.text:
+                if not response.content:
                     logger.warning(f"Received empty response from crt.sh for {website}")
-                    return False
+                    return []
                 
                 try:
-                    data = response.json()
-                except json.JSONDecodeError:
+                    data = parse_json_bytes(response.content)
+                except ValueError:
                     logger.error(f"Failed to decode JSON from crt.sh for {website}")
-                    return False
+                    return []
 
                 subdomains = self.extract_subdomains_from_crtsh(data)
                 
@@ -239,7 +397,9 @@ class SubdomainBot:
                 else:
                     logger.info(f"Found {len(subdomains)} subdomains on crt.sh for {website}")
 
-                return self.process_new_subdomains(website, subdomains)  # Returns True if new subdomains found
+                new_subdomains = self.process_new_subdomains(website, subdomains)
+                self.update_http_cache(website, response)
+                return new_subdomains
 
             except requests.exceptions.Timeout as e:
                 # Handle timeout errors specifically with longer backoff
@@ -247,90 +407,156 @@ class SubdomainBot:
                 logger.warning(f"Timeout error for {website} (attempt {attempt + 1}/{retries}): {e}")
                 if attempt + 1 < retries:
                     logger.info(f"Waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
+                    if stop_event.wait(wait_time):
+                        return []
                 else:
                     error_message = f"Could not fetch data from crt.sh for {website} after {retries} attempts: {e}"
                     logger.error(error_message)
                     self.send_error_notification(error_message)
-                    return False
+                    return []
             except requests.RequestException as e:
                 wait_time = (2 ** attempt) * 30  # Exponential backoff: 30s, 60s, 120s
                 logger.warning(f"Attempt {attempt + 1}/{retries} failed for {website}: {e}")
                 if attempt + 1 < retries:
                     logger.info(f"Waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
+                    if stop_event.wait(wait_time):
+                        return []
                 else:
                     error_message = f"Could not fetch data from crt.sh for {website} after {retries} attempts: {e}"
                     logger.error(error_message)
                     self.send_error_notification(error_message)
-                    return False
+                    return []
+
+    def update_http_cache(self, website, response):
+        """Remember the cache validators of a crt.sh response for the next conditional request."""
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['last_modified'] = response.headers['Last-Modified']
+        with self.state_lock:
+            if self.http_cache.get(website, {}) == validators:
+                return
+            if validators:
+                self.http_cache[website] = validators
+            else:
+                self.http_cache.pop(website, None)
+            save_json(HTTP_CACHE_FILE, self.http_cache)
 
     def extract_subdomains_from_crtsh(self, data):
         """Extract unique subdomains from the crt.sh JSON response."""
         subdomains = set()
-        if not isinstance(data, list):
+        if not isinstance(data, JSON_ARRAY_TYPES):
             return subdomains
             
+        # With simdjson only the name_value strings are materialized, not the full cert records
         for entry in data:
             name_value = entry.get('name_value')
             if name_value:
-                # crt.sh often includes multiple lines for the same name, split and add
-                for name in name_value.split('\n'):
-                    # Remove wildcard prefixes
-                    if name.startswith('*.'):
-                        name = name[2:]
-                    subdomains.add(name.lower())
+                # crt.sh often includes multiple lines for the same name, the regex splits
+                # them and strips wildcard prefixes in a single pass
+                subdomains.update(SUBDOMAIN_NAME_RE.findall(name_value.lower()))
         return subdomains
 
     def process_new_subdomains(self, website, found_subdomains):
-        """Process newly found subdomains and send notifications.
-        Returns True if new subdomains were found, False otherwise."""
-        if website not in self.known_subdomains:
-            self.known_subdomains[website] = []
-
-        new_subdomains = []
-        for sub in found_subdomains:
-            if sub not in self.known_subdomains[website]:
-                new_subdomains.append(sub)
-                self.known_subdomains[website].append(sub)
+        """Record newly found subdomains.
+        Returns the sorted list of subdomains that were not known before."""
+        with self.state_lock:
+            known = self.known_subdomains.setdefault(website, set())
+            new_subdomains = found_subdomains - known
+            if new_subdomains:
+                known |= new_subdomains
+                self.append_state_log(website, new_subdomains)
 
         if new_subdomains:
             logger.info(f"Found {len(new_subdomains)} new subdomains on {website}")
-            self.send_notification(website, new_subdomains)
-            save_json(KNOWN_SUBDOMAINS_FILE, self.known_subdomains)
-            return True
-        return False
-
-    def send_notification(self, website, new_subdomains):
-        """Send a notification to the admin about new subdomains."""
-        count = len(new_subdomains)
-        message = f"🚨 *New subdomains detected on {website}*\n\n"
-        message += f"📊 *Total found: {count}*\n\n"
-        message += "\n".join([f"`{s}`" for s in new_subdomains])
+        return sorted(new_subdomains)
+
+    def load_state_log(self):
+        """Fold the entries of the append-only state log into the known subdomains."""
         try:
-            self.bot.send_message(self.config["admin_user_id"], message, parse_mode="Markdown")
-        except Exception as e:
-            logger.error(f"Failed to send notification: {e}")
+            with open(KNOWN_SUBDOMAINS_LOG_FILE, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # A partially written last line after a crash, skip it
+                        logger.warning(f"Skipping malformed line in {KNOWN_SUBDOMAINS_LOG_FILE}")
+                        continue
+                    self.known_subdomains.setdefault(entry['w'], set()).add(entry['s'])
+        except FileNotFoundError:
+            pass
+
+    def append_state_log(self, website, subdomains):
+        """Record newly found subdomains in the append-only state log."""
+        self.state_log.write(b''.join(orjson.dumps({'w': website, 's': s}) + b'\n' for s in subdomains))
+
+    def compact_state(self):
+        """Write a fresh snapshot of the known subdomains and truncate the state log."""
+        with self.state_lock:
+            self.save_known_subdomains()
+            self.state_log.truncate(0)
+            self.last_compaction = time.monotonic()
+        logger.info("Compacted known subdomains state.")
+
+    def save_known_subdomains(self):
+        """Persist the known subdomains, converting the in-memory sets to sorted lists."""
+        save_json(KNOWN_SUBDOMAINS_FILE, {website: sorted(subs) for website, subs in self.known_subdomains.items()})
+
+    def send_batched_notification(self, results):
+        """Send a single notification to the admin about new subdomains on all websites.
+        Messages over Telegram's length limit are split into several."""
+        for chunk in chunk_lines(self.notification_lines(results)):
+            try:
+                self.bot.send_message(self.admin_id, chunk, parse_mode="Markdown")
+            except Exception as e:
+                logger.error(f"Failed to send notification: {e}")
+
+    def notification_lines(self, results):
+        """Yield the lines of the new subdomains notification one at a time."""
+        for i, (website, new_subdomains) in enumerate(results):
+            if i:
+                yield ""
+            yield f"🚨 *New subdomains detected on {website}*"
+            yield ""
+            yield f"📊 *Total found: {len(new_subdomains)}*"
+            yield ""
+            for s in new_subdomains:
+                yield f"`{s}`"
 
     def send_error_notification(self, error_message):
         """Send an error notification to the admin."""
         message = f"⚠️ An error occurred while scanning:\n\n`{error_message}`"
         try:
-            self.bot.send_message(self.config["admin_user_id"], message, parse_mode="Markdown")
+            self.bot.send_message(self.admin_id, message, parse_mode="Markdown")
         except Exception as e:
             logger.error(f"Failed to send error notification: {e}")
 
     def send_no_new_subdomains_notification(self):
-        """Send a notification when no new subdomains are found during a check cycle."""
-        websites_list = "\n".join([f"• *{site}*" for site in self.config["websites"]])
-        next_scan_time = format_time_interval(CHECK_INTERVAL)
-        message = f"✅ *Scan Complete*\n\n"
-        message += f"🔍 Checked all monitored websites:\n{websites_list}\n\n"
-        message += f"✨ No new subdomains detected this cycle.\n"
-        message += f"💤 All quiet on the subdomain front! 🎯\n\n"
-        message += f"⏰ *Next scan in:* {next_scan_time}"
+        """Send a notification when no new subdomains are found during a check cycle.
+        The full website list is only sent when it changed since the last full notification."""
+        with self.config_lock:
+            websites = tuple(self.config["websites"])
+            if self.websites_list_cache is None:
+                self.websites_list_cache = "\n".join([f"• *{site}*" for site in websites])
+            websites_list = self.websites_list_cache
+        digest = hashlib.blake2b(orjson.dumps(sorted(websites)), digest_size=8).hexdigest()
+        if digest == self.last_notification_digest:
+            message = (
+                f"✅ *Scan Complete* — {len(websites)} site{'s' if len(websites) != 1 else ''} quiet, no new subdomains.\n"
+                f"⏰ *Next scan in:* {NEXT_SCAN_TIME}"
+            )
+        else:
+            message = (
+                f"✅ *Scan Complete*\n\n"
+                f"🔍 Checked all monitored websites:\n{websites_list}\n\n"
+                f"✨ No new subdomains detected this cycle.\n"
+                f"💤 All quiet on the subdomain front! 🎯\n\n"
+                f"⏰ *Next scan in:* {NEXT_SCAN_TIME}"
+            )
         try:
-            self.bot.send_message(self.config["admin_user_id"], message, parse_mode="Markdown")
+            self.bot.send_message(self.admin_id, message, parse_mode="Markdown")
+            self.last_notification_digest = digest
         except Exception as e:
             logger.error(f"Failed to send no new subdomains notification: {e}")
 
@@ -341,9 +567,15 @@ class SubdomainBot:
             self.bot.send_message(message.chat.id, "Invalid URL. Please try again.")
             return
 
-        if website not in self.config["websites"]:
-            self.config["websites"].append(website)
-            save_json(CONFIG_FILE, self.config)
+        with self.config_lock:
+            added = website not in self.website_set
+            if added:
+                self.website_set.add(website)
+                self.config["websites"].append(website)
+                self.websites_list_cache = None
+                save_json(CONFIG_FILE, self.config)
+
+        if added:
             self.bot.send_message(message.chat.id, f"✅ Website '{website}' added successfully.")
         else:
             self.bot.send_message(message.chat.id, f"⚠️ Website '{website}' is already in the list.")
@@ -351,7 +583,8 @@ class SubdomainBot:
 
     def list_websites(self, chat_id):
         """List all monitored websites."""
-        websites = self.config["websites"]
+        with self.config_lock:
+            websites = tuple(self.config["websites"])
         if not websites:
             self.bot.send_message(chat_id, "No websites are currently being monitored.")
             return
@@ -365,7 +598,8 @@ class SubdomainBot:
 
     def show_websites_for_removal(self, chat_id):
         """Prompt the user to enter the website to remove."""
-        websites = self.config["websites"]
+        with self.config_lock:
+            websites = tuple(self.config["websites"])
         if not websites:
             self.bot.send_message(chat_id, "No websites to remove.")
             self.show_main_menu(chat_id)
@@ -382,9 +616,15 @@ class SubdomainBot:
     def remove_website(self, message):
         """Remove a website from the monitoring list based on user input."""
         website_to_remove = message.text.strip()
-        if website_to_remove in self.config["websites"]:
-            self.config["websites"].remove(website_to_remove)
-            save_json(CONFIG_FILE, self.config)
+        with self.config_lock:
+            removed = website_to_remove in self.website_set
+            if removed:
+                self.website_set.discard(website_to_remove)
+                self.config["websites"].remove(website_to_remove)
+                self.websites_list_cache = None
+                save_json(CONFIG_FILE, self.config)
+
+        if removed:
             self.bot.send_message(message.chat.id, f"✅ Website '{website_to_remove}' removed successfully.")
         else:
             self.bot.send_message(message.chat.id, f"⚠️ Website '{website_to_remove}' not found in the list.")